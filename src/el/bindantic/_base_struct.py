@@ -14,6 +14,7 @@ functionality
 
 import typing
 import struct
+import itertools
 from typing import ClassVar
 from ._deps import pydantic
 from ._struct_construction import StructMetaclass, PyStructBaseTypes
@@ -70,6 +71,13 @@ class BaseStruct(pydantic.BaseModel, metaclass=StructMetaclass):
         Size of the structure in packed form in bytes
         """
 
+        __bindantic_unpacking_slices__: ClassVar[tuple[tuple[str, slice, BaseField], ...]]
+        """
+        For every field that provides a value when unpacking (i.e. all except
+        padding and outlets): the field name, the slice of structure elements 
+        it consumes and the field itself.
+        """
+
     def __init__(self, /, **data: typing.Any) -> None:
         super().__init__(**data)
     
@@ -96,11 +104,11 @@ class BaseStruct(pydantic.BaseModel, metaclass=StructMetaclass):
         """
         # concatenate all the tuples of elements provided by the individual fields
         try:
-            return sum((
+            return tuple(itertools.chain.from_iterable(
                 field.packing_preprocessor(getattr(self, name))
                 for name, field
                 in self.struct_fields.items()
-            ), ())
+            ))
         except Exception as e:
             raise StructPackingError(str(e))
     
@@ -118,6 +126,38 @@ class BaseStruct(pydantic.BaseModel, metaclass=StructMetaclass):
                 raise
             raise StructPackingError(str(e))
 
+    def struct_dump_into(self, buffer: bytearray | memoryview, offset: int = 0) -> int:
+        """
+        Packs the struct into its binary representation and writes it
+        directly into the provided writable buffer starting at offset.
+        This avoids allocating a new bytes object for every struct,
+        e.g. when packing many structs into one large buffer.
+
+        Params:
+            buffer: writable buffer to pack the struct into. It must have space for
+                    the packed struct starting at offset, which is the size of
+                    struct_dump_bytes() (this can be more than len(struct) when
+                    using native alignment)
+            offset: position in the buffer at which to start writing
+
+        Raises:
+            StructPackingError: if struct preprocessing or packing fails
+
+        Returns:
+            the number of bytes written to the buffer
+        """
+        try:
+            self.__bindantic_struct_inst__.pack_into(
+                buffer,
+                offset,
+                *(self.struct_dump_elements())
+            )
+        except Exception as e:
+            if isinstance(e, StructPackingError):
+                raise
+            raise StructPackingError(str(e))
+        return self.__bindantic_struct_inst__.size
+
     @classmethod
     def _struct_postprocess_elements(cls, elements: tuple[PyStructBaseTypes, ...]) -> dict[str, typing.Any]:
         """
@@ -136,28 +176,13 @@ class BaseStruct(pydantic.BaseModel, metaclass=StructMetaclass):
         Returns:
             the unpacked structure dict ready for validation
         """
-        output_val_dict: dict[str, typing.Any] = {}
-
-        # just-in-time import this to avoid import reference
-        from ._fields import PaddingField
-
-        # let all fields consume their elements
-        element_offset: int = 0
-        for name, field in cls.struct_fields.items():
-            # padding doesn't consume any elements
-            if isinstance(field, PaddingField):
-                continue
-            # consume elements
-            field_elements = elements[element_offset : (element_offset + field.element_consumption)]
-            element_offset += field.element_consumption
-            # outlet fields consume elements but the data is not processed as it
-            # is instead provided by computed fields
-            if field.is_outlet:
-                continue
-            # preprocess the data into the desired python object
-            output_val_dict[name] = field.unpacking_postprocessor(field_elements)
-        
-        return output_val_dict
+        # let all fields consume their elements and postprocess them into
+        # the desired python objects
+        return {
+            name: field.unpacking_postprocessor(elements[element_slice])
+            for name, element_slice, field
+            in cls.__bindantic_unpacking_slices__
+        }
 
     @classmethod
     def _struct_unpack_bytes(cls, data: bytes | bytearray) -> dict[str, typing.Any]:
@@ -56,6 +56,8 @@ class BaseField(abc.ABC):
         self.type_annotation: type = ...
         # any annotation metadata passed via typing.Annotated
         self.annotation_metadata: list[Any] = ...
+        # the same annotation metadata grouped by (exact) type for quick lookup
+        self.metadata_by_type: dict[type, list[Any]] = ...
         # whether this field is a top level field in a struct or a nested field in an array
         self.is_top_level: bool = ...
 
@@ -100,6 +102,9 @@ class BaseField(abc.ABC):
         self.pydantic_field = pydantic_field
         self.type_annotation = pydantic_field.annotation
         self.annotation_metadata = pydantic_field.metadata
+        self.metadata_by_type = {}
+        for meta_element in self.annotation_metadata:
+            self.metadata_by_type.setdefault(type(meta_element), []).append(meta_element)
         self.is_top_level = is_top_level
 
         # if this is a top level pydantic field we check for outlets
@@ -603,7 +608,7 @@ class ArrayField(BaseField):
             else:
                 self.parse_mode = "strip-trailing"
 
-        self.struct_code = "".join([self.element_field.struct_code] * self.length)
+        self.struct_code = self.element_field.struct_code * self.length
         self.bytes_consumption = self.length * self.element_field.bytes_consumption
         self.element_consumption = self.length * self.element_field.element_consumption
     
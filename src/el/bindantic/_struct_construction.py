@@ -19,7 +19,7 @@ from copy import deepcopy
 from ._deps import pydantic, ModelMetaclass
 if typing.TYPE_CHECKING:
     from ._base_struct import BaseStruct
-from ._fields import get_field_from_field_info, get_raw_field_field_info
+from ._fields import get_field_from_field_info, get_raw_field_field_info, PaddingField
 
 
 PyStructBaseTypes = bytes | int | bool | float
@@ -110,15 +110,30 @@ class StructMetaclass(ModelMetaclass):
 
         cls.__bindantic_element_consumption__ = 0
         cls.__bindantic_byte_consumption__ = 0
+        unpacking_slices: list[tuple[str, slice, Any]] = []
 
         # collect all the fields to one single big struct
         for name, field in cls.struct_fields.items():
             # create structure string
             cls.__bindantic_struct_code__ += field.struct_code
+            # remember which elements each field consumes when unpacking, so this
+            # doesn't have to be worked out again for every unpacked struct. 
+            # Padding and outlet fields don't provide any values when unpacking.
+            if not isinstance(field, PaddingField) and not field.is_outlet:
+                unpacking_slices.append((
+                    name,
+                    slice(
+                        cls.__bindantic_element_consumption__,
+                        cls.__bindantic_element_consumption__ + field.element_consumption
+                    ),
+                    field
+                ))
             # count element and byte length
             cls.__bindantic_element_consumption__ += field.element_consumption
             cls.__bindantic_byte_consumption__ += field.bytes_consumption
 
+        cls.__bindantic_unpacking_slices__ = tuple(unpacking_slices)
+
         # create pre-compiled python structure
         cls.__bindantic_struct_inst__ = struct.Struct(
             cls.__bindantic_struct_code__
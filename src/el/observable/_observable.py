@@ -51,7 +51,15 @@ class Observable(typing.Generic[T]):
         mutating the value without the Observable's knowledge.
         """
         self._notify()
-    
+
+    def set_silent(self, v: T):
+        """
+        Updates the value without notifying any observers.
+        This can be useful to aggregate multiple updates and
+        propagate them later in one go using force_notify().
+        """
+        self._value = v
+
     @property
     def value(self) -> T:
         """
@@ -19,7 +19,7 @@ widget.
 
 import sys
 from typing import Any, Optional, Union, Literal, Hashable, Iterable, override
-from itertools import zip_longest
+from collections import deque
 from dataclasses import dataclass
 # import cProfile
 # import pstats
@@ -41,6 +41,64 @@ class _InternalOptionEntry[IT](OptionEntry[IT]):
     button: ctk.CTkButton = ...
 
 
+# marker for option properties that did not change in _diff_row
+_UNCHANGED: Any = object()
+
+
+def _diff_row(
+    old_option: _InternalOptionEntry,
+    new_option: OptionEntry,
+) -> tuple[dict[str, Any] | None, bool, bool]:
+    """
+    Compares an existing internal option with a new option of the same ID,
+    copying all changed values to the internal option.
+
+    Returns the button configuration changes required to display the new option
+    (None if nothing changed), whether the button needs to be redrawn to apply them 
+    and whether the button needs to be re-created altogether.
+    The changes are collected in local variables and only turned into a dict if there
+    are any, as most rows usually don't change.
+    """
+    new_text = new_state = new_image = _UNCHANGED
+
+    if old_option.label != new_option.label:
+        old_option.label = new_option.label
+        new_text = new_option.label
+    if old_option.disabled != new_option.disabled:
+        old_option.disabled = new_option.disabled
+        new_state = "disabled" if new_option.disabled else "normal"
+    if old_option.icon is not new_option.icon:   # compare instances, because CTkImage will never equal each other
+        # ctk unfortunately does not properly handle removing icons,
+        # so we need to create a new button when removing the image
+        if old_option.icon is not None and new_option.icon is None:
+            old_option.icon = None
+            return None, False, True
+        old_option.icon = new_option.icon
+        new_image = new_option.icon
+
+    if (
+        new_text is _UNCHANGED
+        and new_state is _UNCHANGED
+        and new_image is _UNCHANGED
+    ):
+        return None, False, False
+
+    changes: dict[str, Any] = {}
+    if new_text is not _UNCHANGED:
+        changes["text"] = new_text
+    if new_state is not _UNCHANGED:
+        changes["state"] = new_state
+    if new_image is not _UNCHANGED:
+        changes["image"] = new_image
+    # image does not automatically trigger redraw
+    return changes, new_image is not _UNCHANGED, False
+
+
+# maximum number of option buttons that are kept around for reuse
+# after their option has been removed
+_BUTTON_POOL_SIZE = 64
+
+
 # IT is the user-specified option ID that can be stored with each option
 # to uniquely identify it independent of the index and the displayed text.
 # This must be hashable to be contained in the selection set and in dict keys
@@ -210,6 +268,12 @@ class CTkListbox[IT: Hashable](ctk.CTkScrollableFrame):
         # that is actually currently shown on the UI. No references
         # to this list or it's elements are ever to be returned to the user.
         self._internal_options: list[_InternalOptionEntry[IT]] = []
+        # option buttons of removed options that are not shown but kept
+        # to be reused for new options, as creating buttons is expensive.
+        # Buttons that have shown an icon are kept separately, because ctk cannot
+        # remove the icon again, so they can only be reused for options with icons.
+        self._button_pool: deque[ctk.CTkButton] = deque()
+        self._icon_button_pool: deque[ctk.CTkButton] = deque()
         # internal mapping to get the index of an option with particular id
         self._id_to_index: dict[IT, int] = {}
 
@@ -221,10 +285,12 @@ class CTkListbox[IT: Hashable](ctk.CTkScrollableFrame):
         # callback whenever an entry is clicked.
         # parameters: index of the element in the listbox and option entry data
         self.on_option_clicked = CallbackManager[int, OptionEntry[IT]]()
-        # observable set of all selected indices (max 1 if multiselect is disabled)
-        self.selected_indices = Observable[set[int]]([])
+        # observable set of all selected indices (max 1 if multiselect is disabled).
+        # The set is immutable and replaced on every change, so observers can
+        # keep a reference to it and compare it by identity.
+        self.selected_indices = Observable[frozenset[int]](frozenset())
         # observable set of all selected IDs (max 1 if multiselect is disabled)
-        self.selected_ids = Observable[set[IT]]([])
+        self.selected_ids = Observable[frozenset[IT]](frozenset())
 
         # bindings to detect key presses
         # self._shift_pressed is already provided by CTkScrollableFrame
@@ -275,8 +341,8 @@ class CTkListbox[IT: Hashable](ctk.CTkScrollableFrame):
                 prev_opt.selected = False
                 self._update_button_selected(prev_opt)
             # update selection sets
-            self.selected_indices.value = set()
-            self.selected_ids.value = set()
+            self.selected_indices.value = frozenset()
+            self.selected_ids.value = frozenset()
     
     @override
     def _set_scaling(self, new_widget_scaling, new_window_scaling):
@@ -336,6 +402,9 @@ class CTkListbox[IT: Hashable](ctk.CTkScrollableFrame):
         and only updating tk elements where necessary in an effort to keep slow tk 
         calls to a minimum.
 
+        Options are matched to the existing ones by their ID, so the buttons of
+        options that are still present are kept (and moved if their position
+        changed) and only the buttons of new options have to be created.
         Options are placed in the listbox in the provided order. Selection
         state is retained for objects with the same ID, even if their position has changed.
         Selected objects that have been removed from the list will also be removed from the
@@ -347,84 +416,87 @@ class CTkListbox[IT: Hashable](ctk.CTkScrollableFrame):
             List of options to show in the listbox
         """
 
-        created_options: list[_InternalOptionEntry[IT]] = []
-        deleted_options_from: int = len(self._internal_options) # by default delete no items, i.e. delete starting after the list
+        # skip the leading rows that did not change at all without going through the 
+        # full diff. When options are only appended to the list, this covers all existing rows.
+        # (Option entries may have been mutated in place, so identity alone doesn't mean unchanged)
+        unchanged_count: int = 0
+        for old_option, new_option in zip(self._internal_options, new_options):
+            if (
+                old_option.id != new_option.id
+                or old_option.label != new_option.label
+                or old_option.disabled != new_option.disabled
+                or old_option.icon is not new_option.icon
+            ):
+                break
+            unchanged_count += 1
+        result_options: list[_InternalOptionEntry[IT]] = self._internal_options[:unchanged_count]
+
+        # all remaining old options can be reused by any new option with the same ID,
+        # wherever it is placed (IDs are expected to be unique, any duplicates are not reused).
+        # The buttons of old options that are no longer present are released right away,
+        # so the new options below can take them over instead of creating new ones
+        new_ids = {new_options[index].id for index in range(unchanged_count, len(new_options))}
+        reusable_options: dict[IT, tuple[int, _InternalOptionEntry[IT]]] = {}
+        for index in range(unchanged_count, len(self._internal_options)):
+            old_option = self._internal_options[index]
+            if old_option.id in new_ids and old_option.id not in reusable_options:
+                reusable_options[old_option.id] = (index, old_option)
+            else:
+                self._release_option_button(old_option.button)
+                old_option.button = None
+
+        for index in range(unchanged_count, len(new_options)):
+            new_option = new_options[index]
+            old_index, old_option = reusable_options.pop(new_option.id, (None, None))
 
-        for index, (old_option, new_option) in enumerate(zip_longest(self._internal_options, new_options, fillvalue=None)):
-            # if this is a new entry past the existing list extent, create a new button
+            # there is no existing option with this ID, so it needs a new button
             if old_option is None:
-                btn = self._create_option_button(index, new_option)
-                created_options.append(_InternalOptionEntry(
+                result_options.append(_InternalOptionEntry(
                     id=new_option.id,
                     label=new_option.label,
                     disabled=new_option.disabled,
                     icon=new_option.icon,
-                    selected=new_option.id in self.selected_ids.value,
-                    button=btn,
+                    selected=False, # only existing options can be selected
+                    button=self._create_option_button(index, new_option, selected=False),
                 ))
-
-            # If there is an old option but no matching new one in the position, delete the old button
-            elif new_option is None:
-                old_option.button.grid_forget()
-                old_option.button.destroy()
-                old_option.button = None
-                # save the first index that we need to delete
-                if deleted_options_from > index:
-                    deleted_options_from = index
-
-            # if there is an old and a new option, see if there are any changes and update the button if required
-            else:
-                changes: dict[str, Any] = {}
-                require_redraw: bool = False
-                need_new_button: bool = False
-
-                if old_option.id != new_option.id:
-                    old_option.id = new_option.id
-                    # if the ID changed, we need to check if this ID
-                    # is still one that is currently selected. This happens most
-                    # commonly when element positions change
-                    new_selected = new_option.id in self.selected_ids.value
-                    if old_option.selected != new_selected:
-                        old_option.selected = new_selected
-                        changes["fg_color"] = (
-                            self._option_selected_color
-                            if old_option.selected
-                            else self._option_fg_color
-                        )
-                if old_option.label != new_option.label:
-                    old_option.label = new_option.label
-                    changes["text"] = new_option.label
-                if old_option.disabled != new_option.disabled:
-                    old_option.disabled = new_option.disabled
-                    changes["state"] = "disabled" if new_option.disabled else "normal"
-                if old_option.icon is not new_option.icon:   # compare instances, because CTkImage will never equal each other
-                    # ctk unfortunately does not properly handle removing icons,
-                    # so we need to create a new button when removing the image
-                    if old_option.icon is not None and new_option.icon is None:
-                        need_new_button = True
-                    old_option.icon = new_option.icon
-                    changes["image"] = new_option.icon
-                    require_redraw = True   # image does not automatically trigger redraw
-
-                if need_new_button:
-                    old_option.button.grid_forget()
-                    old_option.button.destroy()
-                    old_option.button = self._create_option_button(index, old_option)
-                elif len(changes) != 0:
-                    old_option.button.configure(require_redraw=require_redraw, **changes)
-
-        # delete no longer existing entries and add new ones
-        self._internal_options = self._internal_options[:deleted_options_from] + created_options
-        # update data->index mapping
-        self._id_to_index = {
-            o.id: i for i, o in enumerate(self._internal_options)
-        }
+                continue
+
+            # otherwise see if there are any changes and update the button if required
+            changes, require_redraw, need_new_button = _diff_row(old_option, new_option)
+            if need_new_button:
+                self._release_option_button(old_option.button)
+                old_option.button = self._create_option_button(index, old_option, selected=old_option.selected)
+                result_options.append(old_option)
+                continue
+            if old_index != index:
+                # move the button to the new position and update the index it reports when clicked
+                old_option.button.grid_configure(row=index)
+                changes = changes or {}
+                changes["command"] = lambda i=index: self._on_option_clicked(i)
+            if changes is not None:
+                old_option.button.configure(require_redraw=require_redraw, **changes)
+            result_options.append(old_option)
+
+        # destroy the released buttons that were not taken over by any new option
+        # and don't fit into the pools for later calls
+        for pool in (self._button_pool, self._icon_button_pool):
+            while len(pool) > _BUTTON_POOL_SIZE:
+                pool.pop().destroy()
+
+        # update data->index mapping. The unchanged leading options keep their
+        # index, so only the mappings of the following ones need to be replaced
+        for old_option in self._internal_options[unchanged_count:]:
+            if self._id_to_index.get(old_option.id, -1) >= unchanged_count:
+                del self._id_to_index[old_option.id]
+        for index in range(unchanged_count, len(result_options)):
+            self._id_to_index[result_options[index].id] = index
+        self._internal_options = result_options
 
         # update selection sets to remove all previously selected elements that don't exist anymore
-        self.selected_indices.value = set(
+        self.selected_indices.value = frozenset(
             i for i, option in enumerate(self._internal_options) if option.selected
         )
-        self.selected_ids.value = set(
+        self.selected_ids.value = frozenset(
             option.id for option in self._internal_options if option.selected
         )
 
@@ -459,8 +531,9 @@ class CTkListbox[IT: Hashable](ctk.CTkScrollableFrame):
             selected one (None for deselect). Usually you don't want to do this during 
             programmatic selection as to not disturb user interactions, so this defaults to True.
         notify : bool, optional
-            Whether to notify observers. Disable this if you whish to aggregate updates 
-            of multiple calls. Defaults to True.
+            Whether to notify observers. Observers are notified at most once per call,
+            no matter how many options changed. Disable this if you whish to aggregate 
+            updates of multiple calls. Defaults to True.
         
         Raises
         ------
@@ -468,14 +541,34 @@ class CTkListbox[IT: Hashable](ctk.CTkScrollableFrame):
             If an out-of-range option index is passed to this function
         """
 
-        for i in indices:
-            if i >= len(self._internal_options):
-                raise IndexError(f"No option with index '{i}' exists in this listbox")
-
-            if selected:
-                self._perform_add_select(i, self._internal_options[i], keep_last=keep_last, notify=notify)
+        # collect all changes locally and publish them in one go at the end,
+        # so observers only run once per call instead of once per changed option
+        new_indices = set(self.selected_indices.value)
+        new_ids = set(self.selected_ids.value)
+        try:
+            for i in indices:
+                if i >= len(self._internal_options):
+                    raise IndexError(f"No option with index '{i}' exists in this listbox")
+
+                option = self._internal_options[i]
+                if selected:
+                    if self._perform_add_select(i, option, keep_last=keep_last):
+                        new_indices.add(i)
+                        new_ids.add(option.id)
+                else:
+                    if self._perform_deselect(i, option, keep_last=keep_last):
+                        new_indices.discard(i)
+                        new_ids.discard(option.id)
+        finally:
+            # also publish the options that were already changed when aborted early,
+            # so the selection sets always match the option states
+            if notify:
+                # observers are only notified if the sets actually changed
+                self.selected_indices.value = frozenset(new_indices)
+                self.selected_ids.value = frozenset(new_ids)
             else:
-                self._perform_deselect(i, self._internal_options[i], keep_last=keep_last, notify=notify)
+                self.selected_indices.set_silent(frozenset(new_indices))
+                self.selected_ids.set_silent(frozenset(new_ids))
 
     def set_selected_by_id(
         self,
@@ -499,8 +592,9 @@ class CTkListbox[IT: Hashable](ctk.CTkScrollableFrame):
             selected one (None for deselect). Usually you don't want to do this during 
             programmatic selection as to not disturb user interactions, so this defaults to True.
         notify : bool, optional
-            Whether to notify observers. Disable this if you whish to aggregate updates 
-            of multiple calls. Defaults to True.
+            Whether to notify observers. Observers are notified at most once per call,
+            no matter how many options changed. Disable this if you whish to aggregate 
+            updates of multiple calls. Defaults to True.
         
         Raises
         ------
@@ -519,10 +613,34 @@ class CTkListbox[IT: Hashable](ctk.CTkScrollableFrame):
         except KeyError as e:
             raise KeyError(f"No option with ID {e} exists in this listbox")
 
-    def _create_option_button(self, index: int, option: OptionEntry) -> ctk.CTkButton:
+    def _create_option_button(self, index: int, option: OptionEntry, selected: bool) -> ctk.CTkButton:
+        """
+        creates and places the button for an option, reusing a previously
+        released button if one is available. The button is colored according
+        to the selected state of the row it is created for.
+        """
+        if option.icon is not None and self._icon_button_pool:
+            btn = self._icon_button_pool.popleft()
+        elif self._button_pool:
+            btn = self._button_pool.popleft()
+        else:
+            btn = None
+
+        if btn is not None:
+            btn.configure(
+                require_redraw=True,
+                fg_color=self._option_selected_color if selected else self._option_fg_color,
+                text=option.label,
+                image=option.icon,
+                state="disabled" if option.disabled else "normal",
+                command=lambda i=index: self._on_option_clicked(i)
+            )
+            btn.grid(row=index, column=0, padx=0, pady=(0, 5), sticky="nsew")
+            return btn
+
         btn = ctk.CTkButton(
             master=self,
-            fg_color=self._option_selected_color if option.id in self.selected_ids.value else self._option_fg_color,
+            fg_color=self._option_selected_color if selected else self._option_fg_color,
             hover_color=self._option_hover_color,
             text_color=self._option_text_color,
             text_color_disabled=self._option_text_color_disabled,
@@ -541,6 +659,18 @@ class CTkListbox[IT: Hashable](ctk.CTkScrollableFrame):
         btn.grid(row=index, column=0, padx=0, pady=(0, 5), sticky="nsew")
         return btn
 
+    def _release_option_button(self, btn: ctk.CTkButton) -> None:
+        """
+        removes an option button from the listbox and keeps it for reuse.
+        The pools are only trimmed to their maximum size at the end of
+        set_options(), so released buttons can all be reused within the same call.
+        """
+        btn.grid_forget()
+        if btn.cget("image") is None:
+            self._button_pool.append(btn)
+        else:
+            self._icon_button_pool.append(btn)
+
     def _on_option_clicked(self, index: int) -> None:
         """ Option button click event handler """
         clicked_option = self._internal_options[index]
@@ -577,7 +707,9 @@ class CTkListbox[IT: Hashable](ctk.CTkScrollableFrame):
                     # if we don't have any previously selected element yet,
                     # simply add this one to the selection
                     if self._last_selected_index is None:
-                        self._perform_add_select(index, clicked_option)
+                        if self._perform_add_select(index, clicked_option):
+                            self.selected_indices.value = self.selected_indices.value | {index}
+                            self.selected_ids.value = self.selected_ids.value | {clicked_option.id}
 
                     # otherwise we can select all items between the last and this
                     # option
@@ -600,17 +732,25 @@ class CTkListbox[IT: Hashable](ctk.CTkScrollableFrame):
 
                         # update the actual button selection
                         # here we keep the last selected index in place, so the user can modify this range
-                        # again, and we don't notify the observers, as we will do one cumulative notify
-                        # at the end
+                        # again, and we collect the new selection sets locally, so the observers are
+                        # notified only once at the end
+                        new_indices = set(self.selected_indices.value)
+                        new_ids = set(self.selected_ids.value)
                         for i in to_be_deselected:
-                            self._perform_deselect(i, self._internal_options[i], keep_last=True, notify=False)
+                            option = self._internal_options[i]
+                            if self._perform_deselect(i, option, keep_last=True):
+                                new_indices.discard(i)
+                                new_ids.discard(option.id)
                         for i in to_be_selected:
-                            self._perform_add_select(i, self._internal_options[i], keep_last=True, notify=False)
+                            option = self._internal_options[i]
+                            if self._perform_add_select(i, option, keep_last=True):
+                                new_indices.add(i)
+                                new_ids.add(option.id)
 
                         # now notify all listeners if the selection changed
                         if final_selected_range != self._last_range_select_set:
-                            self.selected_indices.force_notify()
-                            self.selected_ids.force_notify()
+                            self.selected_indices.value = frozenset(new_indices)
+                            self.selected_ids.value = frozenset(new_ids)
                             # save new range selection set in case it is modified again
                             self._last_range_select_set = final_selected_range
 
@@ -632,16 +772,18 @@ class CTkListbox[IT: Hashable](ctk.CTkScrollableFrame):
         self._update_button_selected(option)
         self._last_selected_index = index
         # update selection sets all in one go
-        self.selected_indices.value = set((index, ))
-        self.selected_ids.value = set((option.id, ))
+        self.selected_indices.value = frozenset((index, ))
+        self.selected_ids.value = frozenset((option.id, ))
 
-    def _perform_add_select(self, index: int, option: _InternalOptionEntry, *, keep_last: bool = False, notify: bool = True) -> None:
+    def _perform_add_select(self, index: int, option: _InternalOptionEntry, *, keep_last: bool = False) -> bool:
         """
-        adds the provided option to the selection. If it is already selected, 
+        marks the provided option as selected. If it is already selected, 
         or disabled, nothing happens.
+        The selection sets are not touched, the caller has to add the option
+        to them if this returns True (= option was newly selected).
         """
         if option.selected or option.disabled:
-            return
+            return False
 
         option.selected = True
         if not keep_last:
@@ -649,24 +791,17 @@ class CTkListbox[IT: Hashable](ctk.CTkScrollableFrame):
 
         # update button look
         self._update_button_selected(option)
+        return True
 
-        # add element to selection sets
-        if index not in self.selected_indices.value:
-            self.selected_indices.value.add(index)
-            if notify:
-                self.selected_indices.force_notify()
-        if option.id not in self.selected_ids.value:
-            self.selected_ids.value.add(option.id)
-            if notify:
-                self.selected_ids.force_notify()
-
-    def _perform_deselect(self, index: int, option: _InternalOptionEntry, keep_last: bool = False, notify: bool = True) -> None:
+    def _perform_deselect(self, index: int, option: _InternalOptionEntry, keep_last: bool = False) -> bool:
         """
-        removes the provided option from the selection. If it wasn't selected before
-        or is disabled, nothing happens
+        marks the provided option as not selected. If it wasn't selected before
+        or is disabled, nothing happens.
+        The selection sets are not touched, the caller has to remove the option
+        from them if this returns True (= option was newly deselected).
         """
         if not option.selected or option.disabled:
-            return
+            return False
 
         option.selected = False
         if not keep_last:
@@ -674,16 +809,7 @@ class CTkListbox[IT: Hashable](ctk.CTkScrollableFrame):
 
         # update button look
         self._update_button_selected(option)
-
-        # remove element from selection sets
-        if index in self.selected_indices.value:
-            self.selected_indices.value.remove(index)
-            if notify:
-                self.selected_indices.force_notify()
-        if option.id in self.selected_ids.value:
-            self.selected_ids.value.remove(option.id)
-            if notify:
-                self.selected_ids.force_notify()
+        return True
 
     def _perform_toggle_select(self, index: int, option: _InternalOptionEntry) -> None:
         """
@@ -701,19 +827,11 @@ class CTkListbox[IT: Hashable](ctk.CTkScrollableFrame):
 
         # add/remove element from selection sets
         if option.selected:
-            if index not in self.selected_indices.value:
-                self.selected_indices.value.add(index)
-                self.selected_indices.force_notify()
-            if  option.id not in self.selected_ids.value:
-                self.selected_ids.value.add(option.id)
-                self.selected_ids.force_notify()
+            self.selected_indices.value = self.selected_indices.value | {index}
+            self.selected_ids.value = self.selected_ids.value | {option.id}
         else:
-            if index in self.selected_indices.value:
-                self.selected_indices.value.remove(index)
-                self.selected_indices.force_notify()
-            if option.id in self.selected_ids.value:
-                self.selected_ids.value.remove(option.id)
-                self.selected_ids.force_notify()
+            self.selected_indices.value = self.selected_indices.value - {index}
+            self.selected_ids.value = self.selected_ids.value - {option.id}
 
     def _update_button_selected(self, option: _InternalOptionEntry[IT]) -> None:
         """ updates the selected state and reconfigures the button accordingly """
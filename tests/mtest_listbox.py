@@ -15,13 +15,30 @@ import sys
 sys.path.append("./src/")    # allows importing el when running like this: python tests/mtest_listbox.py
 
 import uuid
+import functools
 import random as r
 import customtkinter as ctk
 from PIL import Image
 from el.widgets import CTkListbox, OptionEntry
 
 
+ARROWS_ICON = "/home/melektron/Documents/local_repos/hinstech/da_development/06_rf_eval_analyser/data/assets/arrows.png"
+EXPORT_ICON = "/home/melektron/Documents/local_repos/hinstech/da_development/06_rf_eval_analyser/data/assets/export.png"
+
+@functools.lru_cache(maxsize=64)
+def _icon(path: str) -> ctk.CTkImage:
+    """ shared icon instance for each image file, so it is only read and decoded once """
+    # decode right away so the file can be closed instead of being read lazily later
+    with Image.open(path) as img:
+        img.load()
+    return ctk.CTkImage(light_image=img)
+
+
 if __name__ == "__main__":
+    # load all icons up front
+    _icon(ARROWS_ICON)
+    _icon(EXPORT_ICON)
+
     window = ctk.CTk()
     window.title("CTkListBox")
     window.grid_columnconfigure(0, weight=1)
@@ -50,12 +67,12 @@ if __name__ == "__main__":
             OptionEntry(
                 id=uuid.uuid4(),
                 label="Hello0",
-                icon=ctk.CTkImage(light_image=Image.open("/home/melektron/Documents/local_repos/hinstech/da_development/06_rf_eval_analyser/data/assets/arrows.png"))
+                icon=_icon(ARROWS_ICON)
             ),
             OptionEntry(
                 id=uuid.uuid4(),
                 label="Hello1",
-                icon=ctk.CTkImage(light_image=Image.open("/home/melektron/Documents/local_repos/hinstech/da_development/06_rf_eval_analyser/data/assets/export.png"))
+                icon=_icon(EXPORT_ICON)
             ),
             OptionEntry(
                 id=uuid.uuid4(),
@@ -73,7 +90,7 @@ if __name__ == "__main__":
             OptionEntry(
                 id=uuid.uuid4(),
                 label=f"Hello{len(outer_options)}",
-                icon=ctk.CTkImage(light_image=Image.open("/home/melektron/Documents/local_repos/hinstech/da_development/06_rf_eval_analyser/data/assets/export.png"))
+                icon=_icon(EXPORT_ICON)
             ),
             OptionEntry(
                 id=uuid.uuid4(),
@@ -83,7 +100,7 @@ if __name__ == "__main__":
                 id=uuid.uuid4(),
                 label=f"Hello{len(outer_options) + 2}",
                 disabled=True,
-                icon=ctk.CTkImage(light_image=Image.open("/home/melektron/Documents/local_repos/hinstech/da_development/06_rf_eval_analyser/data/assets/export.png"))
+                icon=_icon(EXPORT_ICON)
             )
         ]
         listbox.set_options(outer_options)
@@ -95,7 +112,7 @@ if __name__ == "__main__":
         outer_options.insert(r.randint(0, len(outer_options)), OptionEntry(
             id=uuid.uuid4(),
             label=f"Hello{len(outer_options)}",
-            icon=ctk.CTkImage(light_image=Image.open("/home/melektron/Documents/local_repos/hinstech/da_development/06_rf_eval_analyser/data/assets/export.png"))
+            icon=_icon(EXPORT_ICON)
         ))
         outer_options.insert(r.randint(0, len(outer_options)), OptionEntry(
             id=uuid.uuid4(),
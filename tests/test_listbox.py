@@ -0,0 +1,79 @@
+"""
+ELEKTRON © 2024 - now
+Written by melektron
+www.elektron.work
+16.10.26, 12:00
+All rights reserved.
+
+This source code is licensed under the Apache-2.0 license found in the
+LICENSE file in the root directory of this source tree.
+
+tests for the listbox widget (require a display, skipped otherwise)
+"""
+
+import pytest
+import tkinter
+from typing import Iterable
+
+ctk = pytest.importorskip("customtkinter")
+
+from el.widgets import CTkListbox, OptionEntry
+
+
+@pytest.fixture
+def window():
+    try:
+        window = ctk.CTk()
+    except tkinter.TclError as e:
+        pytest.skip(f"no display available: {e}")
+    yield window
+    window.destroy()
+
+
+@pytest.fixture
+def created_buttons(monkeypatch: pytest.MonkeyPatch) -> list[ctk.CTkButton]:
+    """ records every button created by the listbox """
+    created: list[ctk.CTkButton] = []
+    class CountingButton(ctk.CTkButton):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(self)
+    monkeypatch.setattr(ctk, "CTkButton", CountingButton)
+    return created
+
+
+def _options(ids: Iterable[int]) -> list[OptionEntry[int]]:
+    return [OptionEntry(id=id, label=f"Option {id}") for id in ids]
+
+
+def test_replace_reuses_buttons(window, created_buttons: list[ctk.CTkButton]):
+    listbox = CTkListbox[int](master=window)
+    listbox.set_options(_options(range(200)))
+    assert len(created_buttons) == 200
+
+    # a full replace takes over the buttons of all removed options
+    listbox.set_options(_options(range(200, 400)))
+    assert len(created_buttons) == 200
+    listbox.set_options(_options(range(400, 600)))
+    assert len(created_buttons) == 200
+    assert [option.button.cget("text") for option in listbox._internal_options] == [
+        f"Option {id}" for id in range(400, 600)
+    ]
+
+    # only a limited number of released buttons is kept once the call is done
+    listbox.set_options([])
+    listbox.set_options(_options(range(200)))
+    assert len(created_buttons) == 400 - 64
+
+
+def test_duplicate_id_not_drawn_selected(window):
+    listbox = CTkListbox[int](master=window, multiselect_mode="toggle")
+    listbox.set_options(_options(range(2)))
+    listbox.set_selected_by_id(True, [0])
+    selected_color = listbox._internal_options[0].button.cget("fg_color")
+
+    # only the row that took over the selected option stays selected
+    listbox.set_options(_options([0, 0]))
+    assert listbox.selected_indices.value == {0}
+    assert listbox._internal_options[0].button.cget("fg_color") == selected_color
+    assert listbox._internal_options[1].button.cget("fg_color") != selected_color